@@ -1,12 +1,19 @@
 import json
 import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
+from email.message import Message
+from functools import lru_cache, partial
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Union
+import orjson
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
-from bs4 import BeautifulSoup
-import re
+import requests_cache
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
 
 
 HEADERS = {
@@ -15,9 +22,42 @@ HEADERS = {
 
 TIMEOUT = 10
 RETRIES = 3
-
-
-@dataclass
+MAX_WORKERS = 8
+CACHE_TTL = 300
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "../data/news_cache")
+
+# Shared session so requests to the same host reuse pooled keep-alive connections,
+# with a short-lived on-disk cache so repeated runs don't refetch unchanged feeds
+_SESSION = requests_cache.CachedSession(
+    CACHE_PATH,
+    backend="sqlite",
+    expire_after=CACHE_TTL,
+    allowable_methods=("GET",),
+    # Sspai sends the current time as created_at; keep it out of the cache key
+    ignored_parameters=["created_at"]
+)
+_SESSION.headers.update(HEADERS)
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# CSS selectors used by the HTML scrapers, kept in one place rather than inlined per request
+_HUPU_POST = "li.bbs-sl-web-post-body"
+_HUPU_TITLE = "a.p-title"
+_HN_ROW = "tr.athing"
+_HN_TITLE = "td.title span.titleline a"
+_PH_POST = "[data-test^='post-item']"
+_PH_TITLE = "[data-test^='post-name']"
+_PH_LINK = "a[href^='/posts/']"
+_GITHUB_REPO = "main .Box div[data-hpc] > article"
+_GITHUB_TITLE = "h2 a"
+
+
+# slots=True needs Python 3.10+; older interpreters fall back to a regular dataclass
+_item_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+@_item_dataclass
 class NewsItem:
     title: str
     url: str
@@ -34,30 +74,60 @@ class NewsItem:
         return data
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-def fetch(url: str, params: dict = None) -> Any:
-    try:
-        response = requests.get(url, headers=HEADERS, params=params, timeout=TIMEOUT)
-        response.raise_for_status()
+def _is_retryable(error: requests.RequestException) -> bool:
+    """Retry network failures and 5xx responses; a 4xx won't change on retry"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return error.response is not None and error.response.status_code >= 500
+
+
+def _get(url: str, params: dict = None) -> requests.Response:
+    for attempt in range(RETRIES):
         try:
-            return response.json()
-        except:
-            return response.text
-    except Exception as e:
-        raise Exception(f"Failed to fetch {url}: {str(e)}")
+            response = _SESSION.get(url, params=params, timeout=TIMEOUT)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            if attempt == RETRIES - 1 or not _is_retryable(e):
+                raise Exception(f"Failed to fetch {url}: {str(e)}")
+            # Jitter keeps concurrent retries against the same host from firing in lockstep
+            time.sleep(min(10, max(2, 2 ** attempt)) + random.uniform(0, 1))
+
+
+def fetch_json(url: str, params: dict = None) -> Any:
+    response = _get(url, params)
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise Exception(f"Invalid JSON from {url}: {str(e)}")
+
+
+def fetch_html(url: str, params: dict = None) -> Union[str, bytes]:
+    """Return raw bytes for UTF-8 pages, decoded text for any other declared charset.
+
+    Lexbor reads bytes as UTF-8 and ignores <meta charset>, so only UTF-8 (or
+    undeclared) pages can skip the decode; the rest go through response.text.
+    """
+    response = _get(url, params)
+    content_type = Message()
+    content_type["Content-Type"] = response.headers.get("Content-Type", "")
+    charset = content_type.get_content_charset()
+    if charset in (None, "utf-8", "utf8"):
+        return response.content
+    return response.text
 
 
 def strip_html(text: str) -> str:
     """Remove HTML tags and clean up text"""
     if not text:
         return ""
-    soup = BeautifulSoup(text, "lxml")
-    text = soup.get_text(separator=" ", strip=True)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    text = LexborHTMLParser(text).text(separator=" ", strip=True)
+    return " ".join(text.split())
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
+    """Load sources.json once per process; call load_config.cache_clear() to reload"""
     config_path = os.path.join(os.path.dirname(__file__), "../config/sources.json")
     with open(config_path, "r", encoding="utf-8") as f:
         return json.load(f)
@@ -71,6 +141,12 @@ class NewsSource:
         self.type = config["type"]
         self.category = config["category"]
         self.enabled = config.get("enabled", True)
+        self._make_item = partial(
+            NewsItem,
+            platform=self.platform,
+            platform_icon=self.icon,
+            raw_category=self.category
+        )
 
     def fetch(self) -> List[NewsItem]:
         if not self.enabled:
@@ -95,7 +171,8 @@ class ZhihuSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_api(self) -> List[NewsItem]:
-        data = fetch(self.url)
+        now = datetime.now()
+        data = fetch_json(self.url)
         items = []
         if "data" in data:
             for item in data["data"]:
@@ -105,24 +182,58 @@ class ZhihuSource(NewsSource):
                     continue
                 url = target.get("url", "")
                 content = target.get("excerpt_area", {}).get("text", "")
-                items.append(NewsItem(
+                items.append(self._make_item(
                     title=title,
                     url=url,
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
                     content=content,
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
         return items
 
 
+def _parse_live_item(item: Dict[str, Any], make_item: Callable[..., NewsItem],
+                     now: datetime) -> Optional[NewsItem]:
+    content = item.get("content", "")
+    if not content:
+        return None
+    content = strip_html(content)
+    if not content:
+        return None
+    return make_item(
+        title=content,
+        url="",
+        timestamp=now
+    )
+
+
+def _parse_article_item(item: Dict[str, Any], make_item: Callable[..., NewsItem],
+                        now: datetime) -> Optional[NewsItem]:
+    article = item.get("article")
+    if not article:
+        return None
+    title = article.get("title", "")
+    if not title:
+        return None
+    return make_item(
+        title=title,
+        url=article.get("uri", ""),
+        timestamp=now
+    )
+
+
 class WallStreetCNSource(NewsSource):
+    _PARSERS = {
+        "live": _parse_live_item,
+        "news": _parse_article_item,
+        "hot": _parse_article_item,
+    }
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__("wallstreetcn", config)
         self.endpoints = config["endpoints"]
 
     def _fetch_api(self) -> List[NewsItem]:
+        now = datetime.now()
         items = []
 
         for endpoint_key, endpoint_config in self.endpoints.items():
@@ -130,71 +241,20 @@ class WallStreetCNSource(NewsSource):
             params = endpoint_config.get("params", {})
 
             try:
-                data = fetch(url, params)
-                items.extend(self._parse_endpoint(endpoint_key, data))
+                data = fetch_json(url, params)
+                items.extend(self._parse_endpoint(endpoint_key, data, now))
             except Exception as e:
-                print(f"Failed to fetch {endpoint_key}: {str(e)}")
+                print(f"Failed to fetch {endpoint_key}: {str(e)}", file=sys.stderr)
 
         return items
 
-    def _parse_endpoint(self, endpoint_key: str, data: Any) -> List[NewsItem]:
-        items = []
-
-        if "data" not in data or "items" not in data["data"]:
-            return items
-
-        if endpoint_key == "live":
-            for item in data["data"]["items"]:
-                content = item.get("content", "")
-                if not content:
-                    continue
-                content = strip_html(content)
-                if not content:
-                    continue
-                items.append(NewsItem(
-                    title=content,
-                    url="",
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
-                    timestamp=datetime.now()
-                ))
-
-        elif endpoint_key == "news":
-            for item in data["data"]["items"]:
-                article = item.get("article")
-                if not article:
-                    continue
-                title = article.get("title", "")
-                if not title:
-                    continue
-                items.append(NewsItem(
-                    title=title,
-                    url=article.get("uri", ""),
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
-                    timestamp=datetime.now()
-                ))
-
-        elif endpoint_key == "hot":
-            for item in data["data"]["items"]:
-                article = item.get("article")
-                if not article:
-                    continue
-                title = article.get("title", "")
-                if not title:
-                    continue
-                items.append(NewsItem(
-                    title=title,
-                    url=article.get("uri", ""),
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
-                    timestamp=datetime.now()
-                ))
+    def _parse_endpoint(self, endpoint_key: str, data: Any, now: datetime) -> List[NewsItem]:
+        parser = self._PARSERS.get(endpoint_key)
+        if not parser or "data" not in data or "items" not in data["data"]:
+            return []
 
-        return items
+        parsed = (parser(item, self._make_item, now) for item in data["data"]["items"])
+        return [news_item for news_item in parsed if news_item]
 
 
 class HupuSource(NewsSource):
@@ -203,27 +263,25 @@ class HupuSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_html(self) -> List[NewsItem]:
-        html = fetch(self.url)
+        now = datetime.now()
+        html = fetch_html(self.url)
         items = []
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        for li in soup.select("li.bbs-sl-web-post-body"):
-            a_tag = li.select_one("a.p-title")
+        for li in tree.css(_HUPU_POST):
+            a_tag = li.css_first(_HUPU_TITLE)
             if not a_tag:
                 continue
-            title = a_tag.get_text(strip=True)
+            title = a_tag.text(strip=True)
             if not title:
                 continue
-            url = a_tag.get("href", "")
+            url = a_tag.attributes.get("href") or ""
             if url and not url.startswith("http"):
                 url = f"https://bbs.hupu.com{url}"
-            items.append(NewsItem(
+            items.append(self._make_item(
                 title=title,
                 url=url,
-                platform=self.platform,
-                platform_icon=self.icon,
-                raw_category=self.category,
-                timestamp=datetime.now()
+                timestamp=now
             ))
 
         return items
@@ -235,7 +293,8 @@ class ThePaperSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_api(self) -> List[NewsItem]:
-        data = fetch(self.url)
+        now = datetime.now()
+        data = fetch_json(self.url)
         items = []
 
         if "data" in data:
@@ -244,13 +303,10 @@ class ThePaperSource(NewsSource):
                 if not title:
                     continue
                 cont_id = item.get("contId", "")
-                items.append(NewsItem(
+                items.append(self._make_item(
                     title=title,
                     url=f"https://www.thepaper.cn/newsDetail_forward_{cont_id}" if cont_id else "",
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
 
         return items
@@ -262,25 +318,23 @@ class HackerNewsSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_html(self) -> List[NewsItem]:
-        html = fetch(self.url)
+        now = datetime.now()
+        html = fetch_html(self.url)
         items = []
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        for tr in soup.select("tr.athing"):
-            title_cell = tr.select_one("td.title span.titleline a")
+        for tr in tree.css(_HN_ROW):
+            title_cell = tr.css_first(_HN_TITLE)
             if not title_cell:
                 continue
-            title = title_cell.get_text(strip=True)
-            url = title_cell.get("href", "")
+            title = title_cell.text(strip=True)
+            url = title_cell.attributes.get("href") or ""
             if not title:
                 continue
-            items.append(NewsItem(
+            items.append(self._make_item(
                 title=title,
                 url=url,
-                platform=self.platform,
-                platform_icon=self.icon,
-                raw_category=self.category,
-                timestamp=datetime.now()
+                timestamp=now
             ))
 
         return items
@@ -292,26 +346,24 @@ class ProductHuntSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_html(self) -> List[NewsItem]:
-        html = fetch(self.url)
+        now = datetime.now()
+        html = fetch_html(self.url)
         items = []
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        for post in soup.select("[data-test^='post-item']"):
-            title_elem = post.find(attrs={"data-test": lambda x: x and x.startswith("post-name")})
+        for post in tree.css(_PH_POST):
+            title_elem = post.css_first(_PH_TITLE)
             if not title_elem:
                 continue
-            title = title_elem.get_text(strip=True)
+            title = title_elem.text(strip=True)
             if not title:
                 continue
-            link_elem = post.select_one("a[href^='/posts/']")
-            url = f"https://www.producthunt.com{link_elem.get('href', '')}" if link_elem else ""
-            items.append(NewsItem(
+            link_elem = post.css_first(_PH_LINK)
+            url = f"https://www.producthunt.com{link_elem.attributes.get('href') or ''}" if link_elem else ""
+            items.append(self._make_item(
                 title=title,
                 url=url,
-                platform=self.platform,
-                platform_icon=self.icon,
-                raw_category=self.category,
-                timestamp=datetime.now()
+                timestamp=now
             ))
 
         return items
@@ -323,27 +375,25 @@ class GitHubSource(NewsSource):
         self.url = config["url"]
 
     def _fetch_html(self) -> List[NewsItem]:
-        html = fetch(self.url)
+        now = datetime.now()
+        html = fetch_html(self.url)
         items = []
-        soup = BeautifulSoup(html, "lxml")
+        tree = LexborHTMLParser(html)
 
-        for article in soup.select("main .Box div[data-hpc] > article"):
-            a_tag = article.select_one("h2 a")
+        for article in tree.css(_GITHUB_REPO):
+            a_tag = article.css_first(_GITHUB_TITLE)
             if not a_tag:
                 continue
-            title = a_tag.get_text(strip=True).replace("\n", "").strip()
+            title = a_tag.text(strip=True).replace("\n", "").strip()
             if not title:
                 continue
-            url = a_tag.get("href", "")
+            url = a_tag.attributes.get("href") or ""
             if url and not url.startswith("http"):
                 url = f"https://github.com{url}"
-            items.append(NewsItem(
+            items.append(self._make_item(
                 title=title,
                 url=url,
-                platform=self.platform,
-                platform_icon=self.icon,
-                raw_category=self.category,
-                timestamp=datetime.now()
+                timestamp=now
             ))
 
         return items
@@ -356,9 +406,10 @@ class SspaiSource(NewsSource):
         self.params = config.get("params", {})
 
     def _fetch_api(self) -> List[NewsItem]:
+        now = datetime.now()
         params = self.params.copy()
-        params["created_at"] = int(datetime.now().timestamp())
-        data = fetch(self.url, params)
+        params["created_at"] = int(now.timestamp())
+        data = fetch_json(self.url, params)
         items = []
 
         if "data" in data:
@@ -366,14 +417,11 @@ class SspaiSource(NewsSource):
                 title = item.get("title", "")
                 if not title:
                     continue
-                items.append(NewsItem(
+                items.append(self._make_item(
                     title=title,
                     url=item.get("id", ""),
-                    platform=self.platform,
-                    platform_icon=self.icon,
-                    raw_category=self.category,
                     content=item.get("summary", ""),
-                    timestamp=datetime.now()
+                    timestamp=now
                 ))
 
         return items
@@ -393,7 +441,10 @@ SOURCE_MAP = {
 
 def fetch_all_news() -> List[NewsItem]:
     config = load_config()
+    # requests-cache never purges expired responses on its own
+    _SESSION.cache.delete(expired=True)
     all_items = []
+    sources = []
 
     for platform_id, platform_config in config["platforms"].items():
         if not platform_config.get("enabled", True):
@@ -401,42 +452,62 @@ def fetch_all_news() -> List[NewsItem]:
 
         source_class = SOURCE_MAP.get(platform_id)
         if not source_class:
-            print(f"Unknown platform: {platform_id}")
+            print(f"Unknown platform: {platform_id}", file=sys.stderr)
             continue
 
         try:
-            source = source_class(platform_config)
-            items = source.fetch()
-            print(f"{platform_id}: fetched {len(items)} items")
-            all_items.extend(items)
+            sources.append((platform_id, source_class(platform_config)))
         except Exception as e:
-            print(f"Error fetching from {platform_id}: {str(e)}")
+            print(f"Error fetching from {platform_id}: {str(e)}", file=sys.stderr)
+
+    if not sources:
+        return all_items
+
+    # Fetch concurrently, but keep the output in config order
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(sources))) as executor:
+        futures = {executor.submit(source.fetch): platform_id for platform_id, source in sources}
+        for future in as_completed(futures):
+            platform_id = futures[future]
+            try:
+                items = future.result()
+                print(f"{platform_id}: fetched {len(items)} items", file=sys.stderr)
+                results[platform_id] = items
+            except Exception as e:
+                print(f"Error fetching from {platform_id}: {str(e)}", file=sys.stderr)
+
+    # Drop repeats (e.g. an article on both WallStreetCN's news and hot lists):
+    # items with a URL are keyed per platform, URL-less items by title
+    seen = set()
+    for platform_id, _ in sources:
+        for item in results.get(platform_id, []):
+            key = (item.platform, item.url) if item.url else item.title
+            if key in seen:
+                continue
+            seen.add(key)
+            all_items.append(item)
 
     return all_items
 
 
 def main():
-    print("📰 开始抓取新闻...")
+    print("📰 开始抓取新闻...", file=sys.stderr)
 
     items = fetch_all_news()
 
-    print(f"✅ 抓取完成，共 {len(items)} 条新闻")
-
-    output = {
-        "total": len(items),
-        "items": []
-    }
+    print(f"✅ 抓取完成，共 {len(items)} 条新闻", file=sys.stderr)
 
+    # Stream newline-delimited JSON: a header line with the total, then one line per item
+    write = sys.stdout.buffer.write
+    write(orjson.dumps({"total": len(items)}, option=orjson.OPT_APPEND_NEWLINE))
     for item in items:
-        output["items"].append({
+        write(orjson.dumps({
             "title": item.title,
             "url": item.url,
             "platform": item.platform,
             "platform_icon": item.platform_icon,
             "content": item.content
-        })
-
-    print(json.dumps(output, ensure_ascii=False, indent=2))
+        }, option=orjson.OPT_APPEND_NEWLINE))
 
 
 if __name__ == "__main__":